@@ -7,7 +7,7 @@
  * - FastAPI endpoints (@app.get, @app.post, @router.get, etc.)
  * - Flask routes (@app.route, @blueprint.route)
  * - MCP tools (@mcp.tool, @server.tool)
- * - Pydantic BaseModel classes
+ * - Pydantic BaseModel and msgspec Struct classes
  * - Typed functions (for type annotation testing)
  */
 
@@ -524,9 +524,11 @@ export class PythonASTParser implements LanguageParser {
     const statusMatch = decorator.match(/status_code\s*=\s*(\d+)/);
     const statusCode = statusMatch ? parseInt(statusMatch[1], 10) : undefined;
 
-    // Extract response_model
+    // Extract response_model (response_model=None defers to the return annotation)
     const responseModelMatch = decorator.match(/response_model\s*=\s*(\w+)/);
-    const responseModel = responseModelMatch ? responseModelMatch[1] : undefined;
+    const responseModel = responseModelMatch && responseModelMatch[1] !== 'None'
+      ? responseModelMatch[1]
+      : undefined;
 
     // Extract parameters
     const parameters = this.extractParameters(funcInfo.params, path);
@@ -1073,17 +1075,18 @@ export class PythonASTParser implements LanguageParser {
       lineNum: number;
     }> = [];
     
-    // Find class definitions that extend BaseModel
+    // Find class definitions that extend BaseModel or msgspec.Struct
     const classPattern = /class\s+(\w+)\s*\(([^)]+)\)\s*:/g;
     let match: RegExpExecArray | null;
 
     while ((match = classPattern.exec(content)) !== null) {
       const className = match[1];
-      const bases = match[2].split(',').map(b => b.trim());
+      // Drop class keywords such as kw_only=True / frozen=True
+      const bases = match[2].split(',').map(b => b.trim()).filter(b => b && !b.includes('='));
       
       // Check if it extends BaseModel (directly or indirectly)
       const isBaseModel = bases.some(b =>
-        b === 'BaseModel' ||
+        this.isModelRoot(b) ||
         b.includes('BaseModel') ||
         this.isSubclassOfBaseModel(b)
       );
@@ -1123,7 +1126,7 @@ export class PythonASTParser implements LanguageParser {
       // Collect inherited fields recursively
       const collectInheritedFields = (bases: string[]) => {
         for (const base of bases) {
-          if (base === 'BaseModel') continue;
+          if (this.isModelRoot(base)) continue;
           
           const baseModel = this.typeResolver.getModel(base);
           if (baseModel) {
@@ -1178,6 +1181,13 @@ export class PythonASTParser implements LanguageParser {
     return schemas;
   }
 
+  /**
+   * Check if a base class name is a model root (Pydantic BaseModel or msgspec Struct)
+   */
+  private isModelRoot(base: string): boolean {
+    return base === 'BaseModel' || base === 'Struct' || base === 'msgspec.Struct';
+  }
+
   /**
    * Check if a class is a subclass of BaseModel
    */
@@ -1186,7 +1196,7 @@ export class PythonASTParser implements LanguageParser {
     if (!model) return false;
     
     return model.bases.some(b => 
-      b === 'BaseModel' || this.isSubclassOfBaseModel(b)
+      this.isModelRoot(b) || this.isSubclassOfBaseModel(b)
     );
   }
 
@@ -1212,13 +1222,13 @@ export class PythonASTParser implements LanguageParser {
     const fields: PydanticField[] = [];
     
     // Pattern for field definitions: name: Type = default
-    const fieldPattern = /^\s+(\w+)\s*:\s*([^=\n]+)(?:\s*=\s*(.+))?$/gm;
+    const fieldPattern = /^\s+(\w+)\s*:\s*(.+)$/gm;
     let match: RegExpExecArray | null;
 
     while ((match = fieldPattern.exec(classBody)) !== null) {
       const name = match[1];
-      const typeStr = match[2].trim();
-      const defaultStr = match[3]?.trim();
+      // Split on the first "=" outside brackets so Annotated[..., Meta(ge=0)] stays intact
+      const { typeStr, defaultStr } = this.splitAnnotation(match[2]);
 
       // Skip methods and private fields
       if (name.startsWith('_') || name === 'Config') continue;
@@ -1251,6 +1261,15 @@ export class PythonASTParser implements LanguageParser {
         }
       }
 
+      // msgspec constraints: Annotated[T, msgspec.Meta(ge=0, max_length=200)]
+      const metaMatch = typeStr.match(/\bMeta\s*\(([^)]*)\)/);
+      if (metaMatch) {
+        const metaConstraints = this.parseConstraintArgs(metaMatch[1]);
+        if (metaConstraints) {
+          constraints = { ...metaConstraints, ...constraints };
+        }
+      }
+
       // Check if type is Optional - then not required
       if (typeStr.startsWith('Optional[') || typeStr.includes(' | None')) {
         required = false;
@@ -1270,6 +1289,29 @@ export class PythonASTParser implements LanguageParser {
     return fields;
   }
 
+  /**
+   * Split a field annotation into its type and default at the first top-level "="
+   */
+  private splitAnnotation(annotation: string): { typeStr: string; defaultStr?: string } {
+    let depth = 0;
+
+    for (let i = 0; i < annotation.length; i++) {
+      const char = annotation[i];
+      if (char === '[' || char === '(' || char === '{') {
+        depth++;
+      } else if (char === ']' || char === ')' || char === '}') {
+        depth--;
+      } else if (char === '=' && depth === 0) {
+        return {
+          typeStr: annotation.slice(0, i).trim(),
+          defaultStr: annotation.slice(i + 1).trim() || undefined
+        };
+      }
+    }
+
+    return { typeStr: annotation.trim() };
+  }
+
   /**
    * Parse Field() call for constraints
    */
@@ -1304,8 +1346,34 @@ export class PythonASTParser implements LanguageParser {
       }
     }
 
+    // default_factory=list/dict is the idiomatic spelling of a []/{} default
+    const factoryMatch = args.match(/default_factory\s*=\s*(\w+)/);
+    if (factoryMatch) {
+      result.required = false;
+      if (factoryMatch[1] === 'list') result.default = [];
+      else if (factoryMatch[1] === 'dict') result.default = {};
+    }
+
     // Parse keyword arguments
-    const constraints: PydanticField['constraints'] = {};
+    const constraints = this.parseConstraintArgs(args);
+    if (constraints) {
+      result.constraints = constraints;
+    }
+
+    // Description
+    const descMatch = args.match(/description\s*=\s*["']([^"']+)["']/);
+    if (descMatch) {
+      result.description = descMatch[1];
+    }
+
+    return result;
+  }
+
+  /**
+   * Parse constraint keyword arguments shared by Field() and msgspec.Meta()
+   */
+  private parseConstraintArgs(args: string): PydanticField['constraints'] | undefined {
+    const constraints: NonNullable<PydanticField['constraints']> = {};
 
     const minLengthMatch = args.match(/min_length\s*=\s*(\d+)/);
     if (minLengthMatch) constraints.minLength = parseInt(minLengthMatch[1]);
@@ -1328,17 +1396,7 @@ export class PythonASTParser implements LanguageParser {
     const maxItemsMatch = args.match(/max_items\s*=\s*(\d+)/);
     if (maxItemsMatch) constraints.maxItems = parseInt(maxItemsMatch[1]);
 
-    if (Object.keys(constraints).length > 0) {
-      result.constraints = constraints;
-    }
-
-    // Description
-    const descMatch = args.match(/description\s*=\s*["']([^"']+)["']/);
-    if (descMatch) {
-      result.description = descMatch[1];
-    }
-
-    return result;
+    return Object.keys(constraints).length > 0 ? constraints : undefined;
   }
 
   /**
@@ -5,6 +5,8 @@
  * - httpx.get(), httpx.post(), etc. (sync)
  * - client.get(), client.post() with Client instances
  * - AsyncClient for async operations
+ * - Clients returned by factories annotated -> httpx.Client / -> httpx.AsyncClient
+ * - Streaming requests: client.stream("GET", url), httpx.stream(...)
  * 
  * @see .context/TASK_MAP_P3.md - Task P3-4
  */
@@ -66,6 +68,20 @@ export function detectHttpxCalls(content: string): PythonHttpCall[] {
     clientVars.set(match[1], { isAsync: true });
   }
   
+  // Match: def get_client() -> httpx.AsyncClient: ... client = get_client()
+  const factoryRegex = /\bdef\s+(\w+)\s*\([^)]*\)\s*->\s*(?:httpx\.)?(Async)?Client\s*:/g;
+  while ((match = factoryRegex.exec(content)) !== null) {
+    const isAsync = match[2] !== undefined;
+    const factoryCallRegex = new RegExp(
+      `\\b(\\w+)\\s*=\\s*(?:await\\s+)?${escapeRegex(match[1])}\\s*\\(`,
+      'g'
+    );
+    let callMatch: RegExpExecArray | null;
+    while ((callMatch = factoryCallRegex.exec(content)) !== null) {
+      clientVars.set(callMatch[1], { isAsync });
+    }
+  }
+  
   // Third pass: detect HTTP calls line by line
   for (let i = 0; i < lines.length; i++) {
     const line = lines[i];
@@ -97,6 +113,19 @@ export function detectHttpxCalls(content: string): PythonHttpCall[] {
       }
     }
     
+    // Detect direct httpx.stream("METHOD", url) calls
+    const directStreamRegex = /\bhttpx\.stream\s*\(\s*["'](\w+)["']\s*,/gi;
+    while ((match = directStreamRegex.exec(line)) !== null) {
+      const method = normalizeHttpMethod(match[1]);
+      if (method) {
+        const call = createStreamCall(method, line, lineNum, match);
+        call.isClient = false;
+        call.isAsyncClient = false;
+        call.isAsync = false;
+        calls.push(call);
+      }
+    }
+    
     // Detect client.method() calls
     for (const [clientVar, info] of clientVars) {
       const clientCallRegex = new RegExp(
@@ -113,12 +142,99 @@ export function detectHttpxCalls(content: string): PythonHttpCall[] {
           calls.push(call);
         }
       }
+      
+      // Detect client.stream("METHOD", url) calls
+      const clientStreamRegex = new RegExp(
+        `\\b${escapeRegex(clientVar)}\\.stream\\s*\\(\\s*["'](\\w+)["']\\s*,`,
+        'gi'
+      );
+      while ((match = clientStreamRegex.exec(line)) !== null) {
+        const method = normalizeHttpMethod(match[1]);
+        if (method) {
+          const call = createStreamCall(method, line, lineNum, match);
+          call.isClient = !info.isAsync;
+          call.isAsyncClient = info.isAsync;
+          call.isAsync = info.isAsync;
+          calls.push(call);
+        }
+      }
     }
   }
   
+  assignGatherTargets(calls, lines);
+  
   return calls;
 }
 
+/**
+ * Give calls passed straight to asyncio.gather() the variable they are unpacked into:
+ * a, b = await asyncio.gather(client.get(...), client.post(...))
+ */
+function assignGatherTargets(calls: PythonHttpCall[], lines: string[]): void {
+  const gatherRegex = /^\s*(\w+(?:\s*,\s*\w+)+)\s*=\s*await\s+asyncio\.gather\s*\(/;
+  
+  for (let i = 0; i < lines.length; i++) {
+    const match = lines[i].match(gatherRegex);
+    if (!match) {
+      continue;
+    }
+    
+    // The argument list ends where the parenthesis opened by gather( closes
+    let depth = 0;
+    let end = i;
+    for (let j = i; j < lines.length; j++) {
+      const text = j === i ? lines[j].slice(match[0].length - 1) : lines[j];
+      for (const ch of text) {
+        if (ch === '(') depth++;
+        else if (ch === ')') depth--;
+      }
+      end = j;
+      if (depth <= 0) break;
+    }
+    
+    const targets = match[1].split(',').map(t => t.trim());
+    const gathered = calls
+      .filter(c => c.line >= i + 1 && c.line <= end + 1)
+      .sort((a, b) => a.line - b.line || (a.column ?? 0) - (b.column ?? 0));
+    
+    // Only a one-to-one match of calls to targets can be unpacked reliably
+    if (gathered.length === targets.length) {
+      gathered.forEach((call, k) => {
+        call.responseVariable = targets[k];
+        call.isAsync = true;
+      });
+    }
+  }
+}
+
+/**
+ * Create a PythonHttpCall for a streaming request
+ * 
+ * stream() takes the method as its first argument, so the URL is
+ * extracted from the arguments that follow it.
+ */
+function createStreamCall(
+  method: HttpMethod,
+  line: string,
+  lineNum: number,
+  match: RegExpExecArray
+): PythonHttpCall {
+  const call = createHttpCall(method, 'httpx', line, lineNum, match.index);
+  
+  const urlInfo = extractUrl('(' + line.slice(match.index + match[0].length));
+  call.url = urlInfo?.url;
+  call.isDynamicUrl = urlInfo?.isDynamic;
+  call.pathParams = urlInfo?.pathParams;
+  
+  // Streams are consumed inside a context manager: with client.stream(...) as response:
+  const asMatch = line.match(/\bas\s+(\w+)\s*:/);
+  if (asMatch) {
+    call.responseVariable = asMatch[1];
+  }
+  
+  return call;
+}
+
 /**
  * Create a PythonHttpCall from a detected call
  */
@@ -1,8 +1,140 @@
 # Python aiohttp library HTTP client samples
 # For testing traceUsage() in PythonASTParser
 
+import asyncio
+import logging
+import os
+import re
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Optional, Tuple
+
 import aiohttp
+import orjson
 from aiohttp import ClientSession
+from yarl import URL
+
+# ============================================================================
+# Shared session (one connection pool for the whole module)
+# ============================================================================
+
+_SESSION: Optional[aiohttp.ClientSession] = None
+
+# Pool shared by every session in the module; sessions borrow it with connector_owner=False
+_CONNECTOR: Optional[aiohttp.TCPConnector] = None
+
+# Read window for streamed bodies
+_CHUNK_SIZE = 64 * 1024
+
+# Per-phase limits bound tail latency for every session built on the shared pool
+_DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=5, sock_read=25)
+
+# Idle pooled connections stay open this long (seconds)
+_KEEPALIVE_TIMEOUT = 60
+
+# Per-host pool size; fan-outs cap their in-flight requests at the same bound
+_LIMIT_PER_HOST = 30
+_FETCH_SEMAPHORE: Optional[asyncio.Semaphore] = None
+
+# Bodies above this size are decoded off the event loop
+_OFFLOAD_DECODE_BYTES = 64 * 1024
+
+# Content types resp.json() accepts: application/json and any +json suffix
+_JSON_CONTENT_TYPE = re.compile(r"(?:application/|[\w.-]+/[\w.+-]+?\+)json$", re.IGNORECASE)
+
+# Read-only header sets shared by every call that sends them
+_AUTH_HEADERS = MappingProxyType({"Authorization": "Bearer token123"})
+_SECURE_HEADERS = MappingProxyType({
+    "Authorization": "Bearer token",
+    "X-Custom-Header": "value",
+    "Accept": "application/json"
+})
+
+# Pre-parsed request targets, joined onto the session's base_url without a reparse
+_SEARCH_URL = URL("/search")
+_ORGS_URL = URL("/orgs")
+
+_log = logging.getLogger(__name__)
+
+def _build_trace_config() -> aiohttp.TraceConfig:
+    """Log request timing; only installed when AIOHTTP_TRACE=1."""
+    async def on_request_start(session, ctx, params):
+        ctx.start = asyncio.get_running_loop().time()
+
+    async def on_request_end(session, ctx, params):
+        elapsed = asyncio.get_running_loop().time() - ctx.start
+        _log.debug("%s %s -> %s in %.3fs", params.method, params.url, params.response.status, elapsed)
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_request_end.append(on_request_end)
+    return trace_config
+
+# Tracing callbacks run on every request, so production sessions get none
+_TRACE_CONFIGS = [_build_trace_config()] if os.getenv("AIOHTTP_TRACE") == "1" else []
+
+def _json_dumps(obj: Any) -> str:
+    """orjson encoder for json= bodies; aiohttp expects str from json_serialize."""
+    return orjson.dumps(obj).decode()
+
+def _get_connector() -> aiohttp.TCPConnector:
+    """Lazily create the shared connector (it must be built inside a running loop)."""
+    global _CONNECTOR
+    if _CONNECTOR is None or _CONNECTOR.closed:
+        _CONNECTOR = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=_LIMIT_PER_HOST,
+            keepalive_timeout=_KEEPALIVE_TIMEOUT,
+            force_close=False,
+            use_dns_cache=True,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True
+        )
+    return _CONNECTOR
+
+def _get_fetch_semaphore() -> asyncio.Semaphore:
+    """Lazily create the fan-out semaphore inside the running loop, like the connector."""
+    global _FETCH_SEMAPHORE
+    if _FETCH_SEMAPHORE is None:
+        _FETCH_SEMAPHORE = asyncio.Semaphore(_LIMIT_PER_HOST)
+    return _FETCH_SEMAPHORE
+
+async def _get_session() -> aiohttp.ClientSession:
+    """Lazily create the module-wide session so keep-alive connections are reused."""
+    global _SESSION
+    if _SESSION is None or _SESSION.closed:
+        _SESSION = ClientSession(
+            base_url="https://api.example.com",
+            timeout=_DEFAULT_TIMEOUT,
+            json_serialize=_json_dumps,
+            connector=_get_connector(),
+            connector_owner=False,
+            trace_configs=_TRACE_CONFIGS
+        )
+    return _SESSION
+
+async def keep_warm():
+    """Ping the API within the keep-alive window so pooled sockets aren't evicted while idle."""
+    session = await _get_session()
+    while not session.closed:
+        try:
+            async with session.head("/health"):
+                pass
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            # A failed ping only costs one warm socket; keep the heartbeat running
+            _log.warning("keep-alive ping failed: %r", e)
+        await asyncio.sleep(_KEEPALIVE_TIMEOUT / 2)
+
+async def shutdown():
+    """Close the shared session and its pooled connections on application teardown."""
+    global _SESSION, _CONNECTOR, _FETCH_SEMAPHORE
+    if _SESSION is not None:
+        await _SESSION.close()
+        _SESSION = None
+    if _CONNECTOR is not None:
+        await _CONNECTOR.close()
+        _CONNECTOR = None
+    _FETCH_SEMAPHORE = None
 
 # ============================================================================
 # Basic aiohttp ClientSession patterns
@@ -10,65 +142,75 @@ from aiohttp import ClientSession
 
 async def get_users():
     """Simple GET request with context manager."""
-    async with aiohttp.ClientSession() as session:
-        async with session.get("https://api.example.com/users") as response:
-            users = await response.json()
-            return users
+    session = await _get_session()
+    async with session.get("/users") as response:
+        users = await response.json(loads=orjson.loads)
+        return users
 
 async def get_user(user_id: int):
     """GET request with path parameter."""
-    async with aiohttp.ClientSession() as session:
-        async with session.get(f"https://api.example.com/users/{user_id}") as response:
-            user = await response.json()
-            return user
+    session = await _get_session()
+    async with session.get(f"/users/{user_id}") as response:
+        user = await response.json(loads=orjson.loads)
+        return user
+
+async def _get_user_bounded(session, user_id: int):
+    """Fetch one user while holding a fan-out slot."""
+    async with _get_fetch_semaphore():
+        return await _get_json(session, f"/users/{user_id}")
+
+async def get_users_by_id(user_ids):
+    """Fetch many users concurrently without queueing more requests than the pool can serve."""
+    session = await _get_session()
+    return await asyncio.gather(*(_get_user_bounded(session, uid) for uid in user_ids))
 
 async def create_user(name: str, email: str):
     """POST request with JSON body."""
-    async with aiohttp.ClientSession() as session:
-        async with session.post(
-            "https://api.example.com/users",
-            json={"name": name, "email": email}
-        ) as response:
-            created = await response.json()
-            return created
+    session = await _get_session()
+    async with session.post(
+        "/users",
+        json={"name": name, "email": email}
+    ) as response:
+        created = await response.json(loads=orjson.loads)
+        return created
 
 async def update_user(user_id: int, data: dict):
     """PUT request."""
-    async with aiohttp.ClientSession() as session:
-        async with session.put(
-            f"https://api.example.com/users/{user_id}",
-            json=data
-        ) as response:
-            updated = await response.json()
-            return updated
+    session = await _get_session()
+    async with session.put(
+        f"/users/{user_id}",
+        json=data
+    ) as response:
+        updated = await response.json(loads=orjson.loads)
+        return updated
 
 async def patch_user(user_id: int, updates: dict):
     """PATCH request."""
-    async with aiohttp.ClientSession() as session:
-        async with session.patch(
-            f"https://api.example.com/users/{user_id}",
-            json=updates
-        ) as response:
-            result = await response.json()
-            return result
+    session = await _get_session()
+    async with session.patch(
+        f"/users/{user_id}",
+        json=updates
+    ) as response:
+        result = await response.json(loads=orjson.loads)
+        return result
 
 async def delete_user(user_id: int):
     """DELETE request."""
-    async with aiohttp.ClientSession() as session:
-        async with session.delete(f"https://api.example.com/users/{user_id}") as response:
-            return response.status == 204
+    session = await _get_session()
+    async with session.delete(f"/users/{user_id}") as response:
+        return response.status == 204
 
 async def head_request():
     """HEAD request."""
-    async with aiohttp.ClientSession() as session:
-        async with session.head("https://api.example.com/health") as response:
-            return response.status
+    session = await _get_session()
+    async with session.head("/health") as response:
+        return response.status
 
 async def options_request():
     """OPTIONS request."""
-    async with aiohttp.ClientSession() as session:
-        async with session.options("https://api.example.com/api") as response:
-            return response.headers
+    session = await _get_session()
+    async with session.options("/api") as response:
+        return response.headers
 
 # ============================================================================
 # Response property access patterns
@@ -76,98 +218,226 @@ async def options_request():
 
 async def access_json():
     """Accessing .json() method."""
-    async with aiohttp.ClientSession() as session:
-        async with session.get("https://api.example.com/data") as response:
-            data = await response.json()
-            return data
+    session = await _get_session()
+    async with session.get("/data") as response:
+        data = await response.json(loads=orjson.loads)
+        return data
 
 async def access_text():
     """Accessing .text() method (note: aiohttp uses method, not property)."""
-    async with aiohttp.ClientSession() as session:
-        async with session.get("https://api.example.com/page") as response:
-            text = await response.text()
-            return text
+    session = await _get_session()
+    async with session.get("/page") as response:
+        text = await response.text()
+        return text
 
 async def access_status():
     """Accessing .status property."""
-    async with aiohttp.ClientSession() as session:
-        async with session.get("https://api.example.com/check") as response:
-            status = response.status
-            return status
-
-async def access_content():
-    """Accessing .read() method for bytes."""
-    async with aiohttp.ClientSession() as session:
-        async with session.get("https://api.example.com/file") as response:
-            content = await response.read()
-            return content
+    session = await _get_session()
+    async with session.get("/check") as response:
+        status = response.status
+        return status
+
+async def access_content(sink):
+    """Streaming .content into a writable sink in bounded chunks."""
+    session = await _get_session()
+    async with session.get("/file") as response:
+        async for chunk in response.content.iter_chunked(_CHUNK_SIZE):
+            sink.write(chunk)
+        return response.status
 
 async def access_headers():
     """Accessing .headers property."""
-    async with aiohttp.ClientSession() as session:
-        async with session.get("https://api.example.com/info") as response:
-            headers = response.headers
-            content_type = response.headers.get("Content-Type")
-            return content_type
+    session = await _get_session()
+    async with session.get("/info") as response:
+        headers = response.headers
+        content_type = response.headers.get("Content-Type")
+        return content_type
 
 async def access_ok():
     """Accessing .ok property."""
-    async with aiohttp.ClientSession() as session:
-        async with session.get("https://api.example.com/status") as response:
-            if response.ok:
-                return await response.json()
-            return None
+    session = await _get_session()
+    async with session.get("/status") as response:
+        if response.ok:
+            return await response.json(loads=orjson.loads)
+        return None
 
 async def multiple_properties():
     """Multiple property accesses."""
-    async with aiohttp.ClientSession() as session:
-        async with session.get("https://api.example.com/multi") as response:
-            status = response.status
-            headers = response.headers
-            if response.ok:
-                data = await response.json()
-                return {"status": status, "data": data}
-            else:
-                text = await response.text()
-                return {"status": status, "error": text}
+    session = await _get_session()
+    async with session.get("/multi") as response:
+        status = response.status
+        headers = response.headers
+        if response.ok:
+            data = await response.json(loads=orjson.loads)
+            return {"status": status, "data": data}
+        else:
+            text = await response.text()
+            return {"status": status, "error": text}
 
 # ============================================================================
 # Session with base_url and headers
 # ============================================================================
 
+async def _decode_json(body: bytes) -> Any:
+    """Decode small bodies inline and hand large ones to a worker thread; empty is None."""
+    if not body or body.isspace():
+        return None
+    if len(body) > _OFFLOAD_DECODE_BYTES:
+        return await asyncio.to_thread(orjson.loads, body)
+    return orjson.loads(body)
+
+async def _read_json(reply) -> Any:
+    """ClientResponse.json() on orjson: None for an empty body, ContentTypeError for non-JSON."""
+    body = await reply.read()
+    if body and not body.isspace() and not _JSON_CONTENT_TYPE.match(reply.content_type):
+        raise aiohttp.ContentTypeError(
+            reply.request_info,
+            reply.history,
+            status=reply.status,
+            message=f"Attempt to decode JSON with unexpected mimetype: {reply.content_type}",
+            headers=reply.headers
+        )
+    return await _decode_json(body)
+
+async def _get_json(session, url, **kw):
+    """GET and decode in one await chain; release() hands the connection back to the pool."""
+    resp = await session.get(url, **kw)
+    try:
+        return await _read_json(resp)
+    finally:
+        resp.release()
+
+async def _post_json(session, url, payload):
+    """POST helper so independent requests can run under asyncio.gather."""
+    async with session.post(url, json=payload) as response:
+        return await response.json(loads=orjson.loads)
+
 async def session_with_config():
-    """Session with base URL and headers."""
+    """Session with base URL and headers; closing it leaves the shared pool open."""
     async with aiohttp.ClientSession(
         base_url="https://api.example.com",
-        headers={"Authorization": "Bearer token123"}
+        headers=_AUTH_HEADERS,
+        timeout=_DEFAULT_TIMEOUT,
+        json_serialize=_json_dumps,
+        connector=_get_connector(),
+        connector_owner=False,
+        trace_configs=_TRACE_CONFIGS
     ) as session:
-        async with session.get("/users") as response:
-            users = await response.json()
-        
-        async with session.post("/users", json={"name": "Test"}) as response:
-            created = await response.json()
-        
+        # Independent requests share the session's pool concurrently
+        users, created = await asyncio.gather(
+            _get_json(session, "/users"),
+            _post_json(session, "/users", {"name": "Test"})
+        )
         return users, created
 
 async def reuse_session():
-    """Reuse session for multiple requests."""
-    async with aiohttp.ClientSession() as session:
-        # First request
-        async with session.get("https://api.example.com/items") as response:
-            items = await response.json()
-        
-        # Second request
-        async with session.get("https://api.example.com/categories") as response:
-            categories = await response.json()
-        
-        # Third request with POST
-        async with session.post(
-            "https://api.example.com/items",
-            json={"name": "New Item"}
-        ) as response:
-            new_item = await response.json()
-        
-        return items, categories, new_item
+    """Reuse session for multiple concurrent requests; the GETs revalidate via the ETag cache."""
+    session = await _get_session()
+    items, categories, new_item = await asyncio.gather(
+        get_json_cached("/items"),
+        get_json_cached("/categories"),
+        _post_json(session, "/items", {"name": "New Item"})
+    )
+    return items, categories, new_item
+
+# ============================================================================
+# Batched requests (many small operations in one round trip)
+# ============================================================================
+
+# Asynchronous batching: flush at most this many ops, waiting at most this long
+_BATCH_MAX_OPS = 8
+_BATCH_FLUSH_INTERVAL = 0.005
+
+async def batched(session, ops):
+    """POST (method, path, body) operations to the batch endpoint in one request.
+
+    Results come back in the same order as ops.
+    """
+    payload = {"ops": [{"method": m, "path": p, "body": b} for m, p, b in ops]}
+    async with session.post("/batch", json=payload) as response:
+        return await response.json(loads=orjson.loads)
+
+async def batched_reuse_session():
+    """The reuse_session operations coalesced into a single batch request."""
+    session = await _get_session()
+    ops = [
+        ("GET", "/items", None),
+        ("GET", "/categories", None),
+        ("POST", "/items", {"name": "New Item"}),
+    ]
+    items, categories, new_item = await batched(session, ops)
+    return items, categories, new_item
+
+async def submit(queue: asyncio.Queue, method: str, path: str, body=None):
+    """Queue one operation for batch_worker and wait for its result."""
+    future = asyncio.get_running_loop().create_future()
+    await queue.put(((method, path, body), future))
+    return await future
+
+async def batch_worker(queue: asyncio.Queue):
+    """Drain queued operations, flushing small batches through batched()."""
+    session = await _get_session()
+    loop = asyncio.get_running_loop()
+    while True:
+        pending = [await queue.get()]
+        try:
+            deadline = loop.time() + _BATCH_FLUSH_INTERVAL
+            while len(pending) < _BATCH_MAX_OPS:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    pending.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            results = await batched(session, [op for op, _ in pending])
+            if len(results) != len(pending):
+                raise ValueError(f"batch returned {len(results)} results for {len(pending)} operations")
+        except Exception as e:
+            # Timeouts and undecodable bodies fail the batch too, never strand a waiter
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for (_, future), result in zip(pending, results):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            # On cancellation, anywhere in the batch, cancel whatever is still unresolved
+            for _, future in pending:
+                future.cancel()
+                queue.task_done()
+
+# ============================================================================
+# Conditional GETs (ETag cache)
+# ============================================================================
+
+# path -> (etag, raw body), least recently used first
+_ETAG_CACHE_SIZE = 256
+_etag_cache: "OrderedDict[str, Tuple[str, bytes]]" = OrderedDict()
+
+async def get_json_cached(path: str):
+    """GET with If-None-Match so an unchanged resource comes back as a bodyless 304.
+
+    The cache holds the raw bytes, so every caller gets its own decoded copy.
+    """
+    session = await _get_session()
+    cached = _etag_cache.get(path)
+    headers = {"If-None-Match": cached[0]} if cached else None
+    async with session.get(path, headers=headers) as response:
+        if response.status == 304 and cached:
+            _etag_cache.move_to_end(path)
+            return await _decode_json(cached[1])
+        response.raise_for_status()
+        data = await _read_json(response)
+        etag = response.headers.get("ETag")
+        if etag:
+            # read() returns the body already buffered by _read_json
+            _etag_cache[path] = (etag, await response.read())
+            _etag_cache.move_to_end(path)
+            if len(_etag_cache) > _ETAG_CACHE_SIZE:
+                _etag_cache.popitem(last=False)
+        return data
 
 # ============================================================================
 # Alternative session creation patterns
@@ -178,7 +448,7 @@ async def named_session():
     session = aiohttp.ClientSession()
     try:
         async with session.get("https://api.example.com/data") as response:
-            data = await response.json()
+            data = await response.json(loads=orjson.loads)
             return data
     finally:
         await session.close()
@@ -187,16 +457,16 @@ async def imported_session():
     """Using imported ClientSession."""
     async with ClientSession() as session:
         async with session.get("https://api.example.com/users") as response:
-            return await response.json()
+            return await response.json(loads=orjson.loads)
 
 async def session_variable():
     """Session stored in variable."""
     client = ClientSession(base_url="https://api.example.com")
     try:
         async with client.get("/endpoint") as resp:
-            data = await resp.json()
+            data = await resp.json(loads=orjson.loads)
         async with client.post("/endpoint", json={"key": "value"}) as resp:
-            result = await resp.json()
+            result = await resp.json(loads=orjson.loads)
         return data, result
     finally:
         await client.close()
@@ -207,33 +477,32 @@ async def session_variable():
 
 async def query_params():
     """Request with query parameters."""
-    async with aiohttp.ClientSession() as session:
-        async with session.get(
-            "https://api.example.com/search",
-            params={"q": "test", "page": 1, "limit": 10}
-        ) as response:
-            results = await response.json()
-            return results
+    session = await _get_session()
+    async with session.get(
+        _SEARCH_URL.with_query({"q": "test", "page": 1, "limit": 10})
+    ) as response:
+        results = await response.json(loads=orjson.loads)
+        return results
 
 async def full_url_query():
     """Full URL with query string."""
-    async with aiohttp.ClientSession() as session:
-        async with session.get(
-            "https://api.example.com/items?category=books&sort=price"
-        ) as response:
-            items = await response.json()
-            return items
+    session = await _get_session()
+    async with session.get(
+        "/items?category=books&sort=price"
+    ) as response:
+        items = await response.json(loads=orjson.loads)
+        return items
 
 async def path_segments():
     """Path with multiple segments."""
     org_id = "org-123"
     team_id = "team-456"
-    async with aiohttp.ClientSession() as session:
-        async with session.get(
-            f"https://api.example.com/orgs/{org_id}/teams/{team_id}/members"
-        ) as response:
-            members = await response.json()
-            return members
+    session = await _get_session()
+    async with session.get(
+        _ORGS_URL / org_id / "teams" / team_id / "members"
+    ) as response:
+        members = await response.json(loads=orjson.loads)
+        return members
 
 # ============================================================================
 # Request with custom headers
@@ -241,27 +510,22 @@ async def path_segments():
 
 async def custom_headers():
     """Request with custom headers."""
-    async with aiohttp.ClientSession() as session:
-        async with session.get(
-            "https://api.example.com/secure",
-            headers={
-                "Authorization": "Bearer token",
-                "X-Custom-Header": "value",
-                "Accept": "application/json"
-            }
-        ) as response:
-            return await response.json()
+    session = await _get_session()
+    async with session.get(
+        "/secure",
+        headers=_SECURE_HEADERS
+    ) as response:
+        return await response.json(loads=orjson.loads)
 
 # ============================================================================
 # Request with timeout
 # ============================================================================
 
 async def with_timeout():
-    """Request with timeout."""
-    timeout = aiohttp.ClientTimeout(total=30)
-    async with aiohttp.ClientSession(timeout=timeout) as session:
-        async with session.get("https://api.example.com/slow") as response:
-            return await response.json()
+    """Request bounded by the shared session's _DEFAULT_TIMEOUT."""
+    session = await _get_session()
+    async with session.get("/slow") as response:
+        return await response.json(loads=orjson.loads)
 
 # ============================================================================
 # Error handling
@@ -269,31 +533,46 @@ async def with_timeout():
 
 async def with_error_handling():
     """Request with error handling."""
-    async with aiohttp.ClientSession() as session:
-        try:
-            async with session.get("https://api.example.com/risky") as response:
-                response.raise_for_status()
-                return await response.json()
-        except aiohttp.ClientResponseError as e:
-            print(f"HTTP error: {e.status}")
-            return None
-        except aiohttp.ClientError as e:
-            print(f"Client error: {e}")
-            return None
+    session = await _get_session()
+    try:
+        async with session.get("/risky") as response:
+            response.raise_for_status()
+            return await response.json(loads=orjson.loads)
+    except aiohttp.ClientResponseError as e:
+        print(f"HTTP error: {e.status}")
+        return None
+    except aiohttp.ClientError as e:
+        print(f"Client error: {e}")
+        return None
 
 # ============================================================================
 # Form data and file upload
 # ============================================================================
 
 async def post_form_data():
-    """POST with form data."""
-    async with aiohttp.ClientSession() as session:
-        data = aiohttp.FormData()
-        data.add_field("name", "John")
-        data.add_field("email", "john@example.com")
-        
-        async with session.post(
-            "https://api.example.com/form",
-            data=data
-        ) as response:
-            return await response.json()
+    """POST scalar form fields; a plain dict is sent urlencoded, no multipart needed."""
+    session = await _get_session()
+    async with session.post(
+        "/form",
+        data={"name": "John", "email": "john@example.com"}
+    ) as response:
+        return await response.json(loads=orjson.loads)
+
+async def _file_chunks(path: str):
+    """Yield a file in _CHUNK_SIZE reads, off the event loop."""
+    with open(path, "rb") as f:
+        while chunk := await asyncio.to_thread(f.read, _CHUNK_SIZE):
+            yield chunk
+
+async def upload_file(path: str):
+    """Multipart upload that streams the file instead of loading it into memory."""
+    session = await _get_session()
+    data = aiohttp.FormData()
+    data.add_field(
+        "file",
+        _file_chunks(path),
+        filename=os.path.basename(path),
+        content_type="application/octet-stream"
+    )
+    async with session.post("/upload", data=data) as response:
+        return await response.json(loads=orjson.loads)
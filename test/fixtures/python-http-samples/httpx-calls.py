@@ -1,39 +1,92 @@
 # Python httpx library HTTP client samples
 # For testing traceUsage() in PythonASTParser
 
+import asyncio
+import importlib.util
+from types import MappingProxyType
+from typing import Optional
+
 import httpx
+import orjson
 from httpx import AsyncClient, Client
 
+# ============================================================================
+# Shared async client (one HTTP/2 connection pool, built on first use)
+# ============================================================================
+
+# Per-phase limits for the shared client
+_DEFAULT_TIMEOUT = httpx.Timeout(connect=5.0, read=25.0, write=10.0, pool=5.0)
+
+# http2=True needs the httpx[http2] extra; fall back to HTTP/1.1 without it
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+_aclient: Optional[httpx.AsyncClient] = None
+
+def _get_aclient() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it inside the running loop on first use."""
+    global _aclient
+    if _aclient is None:
+        _aclient = httpx.AsyncClient(
+            base_url="https://api.example.com",
+            timeout=_DEFAULT_TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            http2=_HTTP2
+        )
+    return _aclient
+
+# Read window for streamed bodies
+_CHUNK_SIZE = 64 * 1024
+
+# Read-only header sets shared by every call that sends them
+# Bodies are pre-encoded with orjson and sent as content=
+_JSON_HEADERS = MappingProxyType({"Content-Type": "application/json"})
+_OCTET_STREAM_HEADERS = MappingProxyType({"Content-Type": "application/octet-stream"})
+_SECURE_HEADERS = MappingProxyType({
+    "Authorization": "Bearer token123",
+    "Accept": "application/json",
+    "X-Request-ID": "req-001"
+})
+
+async def shutdown():
+    """Close the shared async client on application teardown."""
+    global _aclient
+    if _aclient is not None:
+        await _aclient.aclose()
+        _aclient = None
+
 # ============================================================================
 # Synchronous httpx.* function calls
 # ============================================================================
 
 # Simple GET request
 response = httpx.get("https://api.example.com/users")
-users = response.json()
+users = orjson.loads(response.content)
 
 # GET with path parameter
 user_id = 456
 response = httpx.get(f"https://api.example.com/users/{user_id}")
-user = response.json()
+user = orjson.loads(response.content)
 
 # POST request with JSON body
 response = httpx.post(
     "https://api.example.com/users",
-    json={"name": "Jane", "email": "jane@example.com"}
+    content=orjson.dumps({"name": "Jane", "email": "jane@example.com"}),
+    headers=_JSON_HEADERS
 )
-created = response.json()
+created = orjson.loads(response.content)
 
 # PUT request
 response = httpx.put(
     f"https://api.example.com/users/{user_id}",
-    json={"name": "Jane Updated"}
+    content=orjson.dumps({"name": "Jane Updated"}),
+    headers=_JSON_HEADERS
 )
 
 # PATCH request
 response = httpx.patch(
     f"https://api.example.com/users/{user_id}",
-    json={"status": "active"}
+    content=orjson.dumps({"status": "active"}),
+    headers=_JSON_HEADERS
 )
 
 # DELETE request
@@ -61,9 +114,11 @@ text = response.text
 response = httpx.get("https://api.example.com/check")
 code = response.status_code
 
-# Accessing .content property (bytes)
-response = httpx.get("https://api.example.com/file")
-content = response.content
+# Streaming the body in bounded chunks instead of buffering .content
+with httpx.stream("GET", "https://api.example.com/file") as response:
+    with open("file.bin", "wb") as f:
+        for chunk in response.iter_bytes(chunk_size=_CHUNK_SIZE):
+            f.write(chunk)
 
 # Accessing .headers property
 response = httpx.get("https://api.example.com/info")
@@ -83,7 +138,7 @@ if response.is_error:
 # Multiple properties
 response = httpx.get("https://api.example.com/multi")
 print(f"Status: {response.status_code}, Success: {response.is_success}")
-data = response.json()
+data = orjson.loads(response.content)
 
 # ============================================================================
 # Synchronous Client usage
@@ -93,19 +148,19 @@ data = response.json()
 client = httpx.Client(base_url="https://api.example.com")
 
 response = client.get("/users")
-users = response.json()
+users = orjson.loads(response.content)
 
-response = client.post("/users", json={"name": "Test"})
+response = client.post("/users", content=orjson.dumps({"name": "Test"}), headers=_JSON_HEADERS)
 
 client.close()
 
 # Client as context manager
 with httpx.Client(base_url="https://api.example.com") as client:
     response = client.get("/items")
-    items = response.json()
+    items = orjson.loads(response.content)
     
-    response = client.post("/items", json={"name": "Item"})
-    new_item = response.json()
+    response = client.post("/items", content=orjson.dumps({"name": "Item"}), headers=_JSON_HEADERS)
+    new_item = orjson.loads(response.content)
 
 # Named client variable
 api_client = Client(
@@ -113,7 +168,7 @@ api_client = Client(
     headers={"Authorization": "Bearer token"}
 )
 response = api_client.get("/protected")
-data = response.json()
+data = orjson.loads(response.content)
 api_client.close()
 
 # ============================================================================
@@ -123,23 +178,24 @@ api_client.close()
 async def fetch_users():
     """Async GET request."""
     response = await httpx.AsyncClient().get("https://api.example.com/users")
-    return response.json()
+    return orjson.loads(response.content)
 
 async def create_user(name: str, email: str):
     """Async POST request."""
     async with httpx.AsyncClient() as client:
         response = await client.post(
             "https://api.example.com/users",
-            json={"name": name, "email": email}
+            content=orjson.dumps({"name": name, "email": email}),
+            headers=_JSON_HEADERS
         )
-        return response.json()
+        return orjson.loads(response.content)
 
 async def update_user(user_id: int, data: dict):
     """Async PUT request."""
     async with httpx.AsyncClient(base_url="https://api.example.com") as client:
-        response = await client.put(f"/users/{user_id}", json=data)
+        response = await client.put(f"/users/{user_id}", content=orjson.dumps(data), headers=_JSON_HEADERS)
         if response.is_success:
-            return response.json()
+            return orjson.loads(response.content)
         return None
 
 async def delete_user(user_id: int):
@@ -148,24 +204,36 @@ async def delete_user(user_id: int):
         response = await client.delete(f"https://api.example.com/users/{user_id}")
         return response.status_code == 204
 
+async def _file_chunks(path: str):
+    """Yield a file in _CHUNK_SIZE reads, off the event loop."""
+    with open(path, "rb") as f:
+        while chunk := await asyncio.to_thread(f.read, _CHUNK_SIZE):
+            yield chunk
+
+async def upload_file(path: str):
+    """Async upload that streams the body instead of loading the file into memory."""
+    client = _get_aclient()
+    response = await client.post("/upload", content=_file_chunks(path), headers=_OCTET_STREAM_HEADERS)
+    return orjson.loads(response.content)
+
 async def complex_operation():
-    """Multiple async requests."""
-    async with httpx.AsyncClient(base_url="https://api.example.com") as client:
-        # Get list
-        response = await client.get("/items")
-        items = response.json()
-        
-        # Create new
-        response = await client.post("/items", json={"name": "New"})
-        new_item = response.json()
-        
-        # Update first
-        if items:
-            item_id = items[0]["id"]
-            response = await client.patch(f"/items/{item_id}", json={"status": "processed"})
-            updated = response.json()
-            
-        return items, new_item
+    """Multiple async requests multiplexed over the shared HTTP/2 client."""
+    client = _get_aclient()
+    # Get list and create new concurrently, as two streams on one connection
+    response, create_response = await asyncio.gather(
+        client.get("/items"),
+        client.post("/items", content=orjson.dumps({"name": "New"}), headers=_JSON_HEADERS)
+    )
+    items = orjson.loads(response.content)
+    new_item = orjson.loads(create_response.content)
+
+    # Update first (needs the listing, so it stays sequential)
+    if items:
+        item_id = items[0]["id"]
+        response = await client.patch(f"/items/{item_id}", content=orjson.dumps({"status": "processed"}), headers=_JSON_HEADERS)
+        updated = orjson.loads(response.content)
+
+    return items, new_item
 
 # ============================================================================
 # URL patterns
@@ -176,7 +244,7 @@ response = httpx.get(
     "https://api.example.com/search",
     params={"query": "test", "limit": 20}
 )
-results = response.json()
+results = orjson.loads(response.content)
 
 # Full URL with query string
 response = httpx.get("https://api.example.com/filter?status=active&page=1")
@@ -185,7 +253,7 @@ response = httpx.get("https://api.example.com/filter?status=active&page=1")
 org = "acme"
 project = "main"
 response = httpx.get(f"https://api.example.com/orgs/{org}/projects/{project}/tasks")
-tasks = response.json()
+tasks = orjson.loads(response.content)
 
 # ============================================================================
 # Request with headers
@@ -193,11 +261,7 @@ tasks = response.json()
 
 response = httpx.get(
     "https://api.example.com/secure",
-    headers={
-        "Authorization": "Bearer token123",
-        "Accept": "application/json",
-        "X-Request-ID": "req-001"
-    }
+    headers=_SECURE_HEADERS
 )
 
 # ============================================================================
@@ -216,7 +280,7 @@ response = httpx.get(
 try:
     response = httpx.get("https://api.example.com/risky")
     response.raise_for_status()
-    data = response.json()
+    data = orjson.loads(response.content)
 except httpx.HTTPStatusError as e:
     print(f"HTTP error: {e.response.status_code}")
 except httpx.RequestError as e:
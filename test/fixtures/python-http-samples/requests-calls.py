@@ -1,8 +1,22 @@
 # Python requests library HTTP client samples
 # For testing traceUsage() in PythonASTParser
 
+from types import MappingProxyType
+
+import orjson
 import requests
 from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Read-only header sets shared by every call that sends them
+# Bodies are pre-encoded with orjson and sent as data=
+_JSON_HEADERS = MappingProxyType({"Content-Type": "application/json"})
+_SECURE_HEADERS = MappingProxyType({
+    "Authorization": "Bearer token",
+    "X-Custom-Header": "custom-value",
+    "Accept": "application/json"
+})
 
 # ============================================================================
 # Basic requests.* function calls
@@ -10,30 +24,33 @@ from requests import Session
 
 # Simple GET request with string URL
 response = requests.get("https://api.example.com/users")
-users = response.json()
+users = orjson.loads(response.content)
 
 # GET with path parameter in f-string
 user_id = 123
 response = requests.get(f"https://api.example.com/users/{user_id}")
-user = response.json()
+user = orjson.loads(response.content)
 
 # POST request with JSON body
 response = requests.post(
     "https://api.example.com/users",
-    json={"name": "John", "email": "john@example.com"}
+    data=orjson.dumps({"name": "John", "email": "john@example.com"}),
+    headers=_JSON_HEADERS
 )
-created = response.json()
+created = orjson.loads(response.content)
 
 # PUT request
 response = requests.put(
     f"https://api.example.com/users/{user_id}",
-    json={"name": "John Updated"}
+    data=orjson.dumps({"name": "John Updated"}),
+    headers=_JSON_HEADERS
 )
 
 # PATCH request
 response = requests.patch(
     f"https://api.example.com/users/{user_id}",
-    json={"email": "newemail@example.com"}
+    data=orjson.dumps({"email": "newemail@example.com"}),
+    headers=_JSON_HEADERS
 )
 
 # DELETE request
@@ -78,7 +95,7 @@ if response.ok:
 # Multiple property accesses on same response
 response = requests.get("https://api.example.com/multi")
 if response.ok:
-    data = response.json()
+    data = orjson.loads(response.content)
     print(f"Status: {response.status_code}")
 else:
     error = response.text
@@ -87,18 +104,25 @@ else:
 # Session-based requests
 # ============================================================================
 
-# Create session and use it
+# Pooled session: one connection pool and retry policy shared by its calls
 session = requests.Session()
+adapter = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=100,
+    max_retries=Retry(total=3, backoff_factor=0.3)
+)
+session.mount("https://", adapter)
 session.headers.update({"Authorization": "Bearer token123"})
 
 # Session GET
 response = session.get("https://api.example.com/protected/users")
-protected_users = response.json()
+protected_users = orjson.loads(response.content)
 
 # Session POST
 response = session.post(
     "https://api.example.com/protected/data",
-    json={"key": "value"}
+    data=orjson.dumps({"key": "value"}),
+    headers=_JSON_HEADERS
 )
 
 # Session with named variable
@@ -106,7 +130,7 @@ api_session = Session()
 api_session.auth = ("user", "pass")
 
 response = api_session.get("https://api.example.com/auth/profile")
-profile = response.json()
+profile = orjson.loads(response.content)
 
 # ============================================================================
 # URL patterns
@@ -121,7 +145,7 @@ response = requests.get(
     "https://api.example.com/search",
     params={"q": "python", "page": 1, "limit": 10}
 )
-search_results = response.json()
+search_results = orjson.loads(response.content)
 
 # Query parameters in URL string
 response = requests.get("https://api.example.com/items?category=books&sort=price")
@@ -137,11 +161,7 @@ response = requests.get(f"https://api.example.com/orgs/{org_id}/teams/{team_id}/
 
 response = requests.get(
     "https://api.example.com/secure",
-    headers={
-        "Authorization": "Bearer token",
-        "X-Custom-Header": "custom-value",
-        "Accept": "application/json"
-    }
+    headers=_SECURE_HEADERS
 )
 
 # ============================================================================
@@ -161,7 +181,7 @@ response = requests.get(
 try:
     response = requests.get("https://api.example.com/might-fail")
     response.raise_for_status()
-    data = response.json()
+    data = orjson.loads(response.content)
 except requests.exceptions.HTTPError as e:
     print(f"HTTP error: {e}")
 except requests.exceptions.RequestException as e:
@@ -5,6 +5,7 @@ Used for testing Python AST parser's FastAPI detection capabilities.
 
 from typing import Optional, List, Dict, Union
 from fastapi import FastAPI, Query, Path, Body, Header, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from datetime import datetime
 
@@ -60,7 +61,7 @@ class ErrorResponse(BaseModel):
 # Basic GET Endpoints
 # =============================================================================
 
-@app.get("/users")
+@app.get("/users", response_class=ORJSONResponse)
 async def list_users(
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
@@ -70,7 +71,7 @@ async def list_users(
     pass
 
 
-@app.get("/users/{user_id}")
+@app.get("/users/{user_id}", response_class=ORJSONResponse)
 async def get_user(user_id: int = Path(..., gt=0)) -> UserResponse:
     """Get a specific user by ID."""
     pass
@@ -152,7 +153,7 @@ async def get_current_user(authorization: str = Header(...)) -> UserResponse:
     pass
 
 
-@app.get("/me", response_model=UserResponse)
+@app.get("/me", response_model=UserResponse, response_class=ORJSONResponse)
 async def get_current_user_profile(
     current_user: UserResponse = Depends(get_current_user)
 ) -> UserResponse:
@@ -173,7 +174,7 @@ async def protected_endpoint(
 # Endpoints with Complex Types
 # =============================================================================
 
-@app.get("/paginated", response_model=PaginatedResponse)
+@app.get("/paginated", response_model=PaginatedResponse, response_class=ORJSONResponse)
 async def get_paginated_users(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100)
@@ -209,7 +210,7 @@ async def verify_user(user_id: int) -> Union[UserResponse, ErrorResponse]:
 # Deprecated Endpoints
 # =============================================================================
 
-@app.get("/v1/users", deprecated=True, response_model=List[UserResponse])
+@app.get("/v1/users", deprecated=True, response_model=List[UserResponse], response_class=ORJSONResponse)
 async def list_users_v1() -> List[UserResponse]:
     """Deprecated: Use /users instead."""
     pass
@@ -224,7 +225,8 @@ async def list_users_v1() -> List[UserResponse]:
     tags=["admin", "users"],
     summary="List all users (admin)",
     description="Admin endpoint to list all users with additional details.",
-    response_model=List[UserResponse]
+    response_model=List[UserResponse],
+    response_class=ORJSONResponse
 )
 async def admin_list_users() -> List[UserResponse]:
     """Admin: List all users."""
@@ -235,13 +237,24 @@ async def admin_list_users() -> List[UserResponse]:
 # Sync Functions (not async)
 # =============================================================================
 
-@app.get("/health")
+@app.get("/health", response_class=ORJSONResponse)
 def health_check() -> dict:
     """Health check endpoint (sync)."""
     return {"status": "healthy"}
 
 
-@app.get("/version")
+@app.get("/version", response_class=ORJSONResponse)
 def get_version() -> dict:
     """Get API version (sync)."""
     return {"version": "1.0.0"}
+
+
+# =============================================================================
+# Server Entry Point
+# =============================================================================
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvloop and httptools keep the socket loop and HTTP parsing in C
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
@@ -3,46 +3,115 @@ FastAPI Router Sample Fixtures
 Used for testing Python AST parser's FastAPI router detection with prefix.
 """
 
-from typing import Optional, List
-from fastapi import APIRouter, Query, Path, Body, Depends, HTTPException
-from pydantic import BaseModel, Field
+import functools
+import inspect
+from typing import Annotated, Any, Optional, List
+
+import msgspec
+from fastapi import APIRouter, Query, Path, Body, Depends, HTTPException, Request
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+
+
+# =============================================================================
+# msgspec Integration
+# =============================================================================
+
+class MsgspecResponse(JSONResponse):
+    """JSON response encoded straight from msgspec Structs."""
+
+    def render(self, content: Any) -> bytes:
+        return msgspec.json.encode(content)
+
+
+class MsgspecRoute(APIRoute):
+    """Route that hands Struct return values to MsgspecResponse itself.
+
+    FastAPI runs jsonable_encoder on a plain return value before the response
+    class renders it, and that cannot encode Structs.
+    """
+
+    def __init__(self, path, endpoint, **kwargs):
+        if inspect.iscoroutinefunction(endpoint):
+            endpoint = self._encode_structs(endpoint, kwargs.get("status_code") or 200)
+        super().__init__(path, endpoint, **kwargs)
+
+    @staticmethod
+    def _encode_structs(endpoint, status_code):
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            content = await endpoint(*args, **kwargs)
+            if isinstance(content, msgspec.Struct) or (
+                isinstance(content, list) and content and isinstance(content[0], msgspec.Struct)
+            ):
+                return MsgspecResponse(content, status_code=status_code)
+            return content
+        return wrapper
+
+
+def _msgspec_body(model):
+    """Dependency that decodes and validates the raw request body in one pass."""
+    decoder = msgspec.json.Decoder(model)
+
+    async def decode(request: Request):
+        try:
+            return decoder.decode(await request.body())
+        except msgspec.ValidationError as exc:
+            raise HTTPException(status_code=422, detail=str(exc))
+        except msgspec.DecodeError as exc:
+            # Malformed JSON; ValidationError subclasses DecodeError, so it is handled above
+            raise HTTPException(status_code=400, detail=str(exc))
+
+    return decode
+
+
+def _msgspec_openapi(model):
+    """openapi_extra documenting the JSON body that _msgspec_body(model) reads from the raw request."""
+    _, components = msgspec.json.schema_components([model], ref_template="#/components/schemas/{name}")
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": components[model.__name__]}},
+        }
+    }
+
 
 # =============================================================================
 # Router with Prefix
 # =============================================================================
 
-router = APIRouter(prefix="/api/v1", tags=["items"])
+router = APIRouter(prefix="/api/v1", tags=["items"], default_response_class=MsgspecResponse, route_class=MsgspecRoute)
 
 
-class Item(BaseModel):
+class Item(msgspec.Struct, kw_only=True):
     """Item model."""
     name: str
     description: Optional[str] = None
-    price: float = Field(..., gt=0)
-    quantity: int = Field(1, ge=0)
+    price: Annotated[float, msgspec.Meta(gt=0)]
+    quantity: Annotated[int, msgspec.Meta(ge=0)] = 1
 
 
-class ItemCreate(BaseModel):
+class ItemCreate(msgspec.Struct, kw_only=True):
     """Request model for creating an item."""
-    name: str = Field(..., min_length=1, max_length=200)
+    name: Annotated[str, msgspec.Meta(min_length=1, max_length=200)]
     description: Optional[str] = None
-    price: float = Field(..., gt=0)
-    quantity: int = Field(1, ge=0)
+    price: Annotated[float, msgspec.Meta(gt=0)]
+    quantity: Annotated[int, msgspec.Meta(ge=0)] = 1
 
 
-class ItemUpdate(BaseModel):
+class ItemUpdate(msgspec.Struct, kw_only=True):
     """Request model for updating an item."""
     name: Optional[str] = None
     description: Optional[str] = None
-    price: Optional[float] = Field(None, gt=0)
-    quantity: Optional[int] = Field(None, ge=0)
+    price: Optional[Annotated[float, msgspec.Meta(gt=0)]] = None
+    quantity: Optional[Annotated[int, msgspec.Meta(ge=0)]] = None
 
 
 # =============================================================================
 # Router GET Endpoints
 # =============================================================================
 
-@router.get("/items")
+@router.get("/items", response_model=None)
 async def list_items(
     skip: int = 0,
     limit: int = Query(10, ge=1, le=100),
@@ -52,7 +121,7 @@ async def list_items(
     pass
 
 
-@router.get("/items/{item_id}")
+@router.get("/items/{item_id}", response_model=None)
 async def get_item(item_id: int = Path(..., gt=0)) -> Item:
     """Get a specific item by ID."""
     pass
@@ -71,13 +140,13 @@ async def get_item_variant(
 # Router POST Endpoints
 # =============================================================================
 
-@router.post("/items", response_model=Item, status_code=201)
-async def create_item(item: ItemCreate) -> Item:
+@router.post("/items", response_model=None, status_code=201, openapi_extra=_msgspec_openapi(ItemCreate))
+async def create_item(item: Annotated[ItemCreate, Depends(_msgspec_body(ItemCreate))]) -> Item:
     """Create a new item."""
     pass
 
 
-@router.post("/items/{item_id}/duplicate")
+@router.post("/items/{item_id}/duplicate", response_model=None)
 async def duplicate_item(item_id: int) -> Item:
     """Duplicate an existing item."""
     pass
@@ -87,14 +156,14 @@ async def duplicate_item(item_id: int) -> Item:
 # Router PUT/PATCH Endpoints
 # =============================================================================
 
-@router.put("/items/{item_id}", response_model=Item)
-async def replace_item(item_id: int, item: ItemCreate) -> Item:
+@router.put("/items/{item_id}", response_model=None, openapi_extra=_msgspec_openapi(ItemCreate))
+async def replace_item(item_id: int, item: Annotated[ItemCreate, Depends(_msgspec_body(ItemCreate))]) -> Item:
     """Replace an item entirely."""
     pass
 
 
-@router.patch("/items/{item_id}", response_model=Item)
-async def update_item(item_id: int, item: ItemUpdate) -> Item:
+@router.patch("/items/{item_id}", response_model=None, openapi_extra=_msgspec_openapi(ItemUpdate))
+async def update_item(item_id: int, item: Annotated[ItemUpdate, Depends(_msgspec_body(ItemUpdate))]) -> Item:
     """Update an item partially."""
     pass
 
@@ -113,10 +182,10 @@ async def delete_item(item_id: int) -> None:
 # Second Router (different prefix)
 # =============================================================================
 
-orders_router = APIRouter(prefix="/api/v1/orders", tags=["orders"])
+orders_router = APIRouter(prefix="/api/v1/orders", tags=["orders"], default_response_class=MsgspecResponse, route_class=MsgspecRoute)
 
 
-class Order(BaseModel):
+class Order(msgspec.Struct, frozen=True):
     """Order model."""
     id: int
     item_ids: List[int]
@@ -124,25 +193,25 @@ class Order(BaseModel):
     status: str
 
 
-@orders_router.get("")
+@orders_router.get("", response_model=None)
 async def list_orders(status: Optional[str] = None) -> List[Order]:
     """List all orders."""
     pass
 
 
-@orders_router.get("/{order_id}")
+@orders_router.get("/{order_id}", response_model=None)
 async def get_order(order_id: int) -> Order:
     """Get a specific order."""
     pass
 
 
-@orders_router.post("", response_model=Order)
+@orders_router.post("", response_model=None)
 async def create_order(item_ids: List[int] = Body(...)) -> Order:
     """Create a new order."""
     pass
 
 
-@orders_router.patch("/{order_id}/status")
+@orders_router.patch("/{order_id}/status", response_model=None)
 async def update_order_status(
     order_id: int,
     status: str = Body(...)
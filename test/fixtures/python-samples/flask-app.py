@@ -4,10 +4,53 @@ Used for testing Python AST parser's Flask route detection capabilities.
 """
 
 from typing import Optional, List, Dict, Union
-from flask import Flask, request, jsonify, abort, g
+
+import orjson
+from flask import Flask, Response, request, jsonify, abort, g
+from flask.json.provider import JSONProvider
 from functools import wraps
 
-app = Flask(__name__)
+
+# =============================================================================
+# orjson JSON Provider
+# =============================================================================
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson for jsonify() and request.get_json()."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        # orjson has no json.dumps-style keywords; map the ones it can express and refuse the rest
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.pop("sort_keys", False):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.pop("indent", None):
+            option |= orjson.OPT_INDENT_2
+        default = kwargs.pop("default", None)
+        if kwargs:
+            raise TypeError(f"OrjsonProvider.dumps() got unsupported arguments: {', '.join(kwargs)}")
+        return orjson.dumps(obj, default=default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs) -> Response:
+        if args and kwargs:
+            raise TypeError("app.json.response() takes either args or kwargs, not both")
+        obj = (args[0] if len(args) == 1 else args) if args else (kwargs or None)
+        return self._app.response_class(self.dumps(obj), mimetype="application/json")
+
+
+# =============================================================================
+# Application
+# =============================================================================
+
+class OrjsonFlask(Flask):
+    """Flask app serving JSON through OrjsonProvider."""
+
+    json_provider_class = OrjsonProvider
+
+
+app = OrjsonFlask(__name__)
 
 
 # =============================================================================
@@ -20,10 +63,13 @@ def index():
     return "Welcome"
 
 
+_HEALTH_BODY = orjson.dumps({"status": "healthy"})
+
+
 @app.route("/health")
 def health_check():
     """Health check endpoint."""
-    return jsonify({"status": "healthy"})
+    return Response(_HEALTH_BODY, mimetype="application/json")
 
 
 @app.route("/users")
@@ -126,24 +172,31 @@ def delete_user(user_id: int):
 # Multiple Methods on Single Route
 # =============================================================================
 
+# Looked up by request.method in resource_handler and items_handler; Flask adds HEAD to GET routes, hence the alias
+_RESOURCE_METHODS = {
+    "GET": lambda resource_id: jsonify({"id": resource_id}),
+    "PUT": lambda resource_id: jsonify({"id": resource_id, "updated": True}),
+    "DELETE": lambda resource_id: ("", 204),
+}
+_RESOURCE_METHODS["HEAD"] = _RESOURCE_METHODS["GET"]
+
+_ITEMS_METHODS = {
+    "GET": lambda: jsonify([]),
+    "POST": lambda: (jsonify(request.get_json()), 201),
+}
+_ITEMS_METHODS["HEAD"] = _ITEMS_METHODS["GET"]
+
+
 @app.route("/resources/<int:resource_id>", methods=["GET", "PUT", "DELETE"])
 def resource_handler(resource_id: int):
     """Handle multiple methods for a resource."""
-    if request.method == "GET":
-        return jsonify({"id": resource_id})
-    elif request.method == "PUT":
-        return jsonify({"id": resource_id, "updated": True})
-    elif request.method == "DELETE":
-        return "", 204
+    return _RESOURCE_METHODS[request.method](resource_id)
 
 
 @app.route("/items", methods=["GET", "POST"])
 def items_handler():
     """Handle GET and POST for items."""
-    if request.method == "GET":
-        return jsonify([])
-    elif request.method == "POST":
-        return jsonify(request.get_json()), 201
+    return _ITEMS_METHODS[request.method]()
 
 
 # =============================================================================
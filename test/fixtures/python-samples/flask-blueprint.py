@@ -4,7 +4,10 @@ Used for testing Python AST parser's Flask Blueprint detection with url_prefix.
 """
 
 from typing import Optional, List, Dict
-from flask import Blueprint, request, jsonify, abort
+
+import orjson
+from flask import Blueprint, Response, request, jsonify, abort
+
 
 # =============================================================================
 # Blueprint with URL Prefix
@@ -89,17 +92,21 @@ def get_variant(product_id: int, variant_id: int):
 
 misc_bp = Blueprint("misc", __name__)
 
+# Constant bodies are encoded once at import; each request only wraps the bytes
+_HEALTH_BODY = orjson.dumps({"status": "ok"})
+_VERSION_BODY = orjson.dumps({"version": "1.0.0"})
+
 
 @misc_bp.route("/health")
 def health():
     """Health check endpoint."""
-    return jsonify({"status": "ok"})
+    return Response(_HEALTH_BODY, mimetype="application/json")
 
 
 @misc_bp.route("/version")
 def version():
     """Version endpoint."""
-    return jsonify({"version": "1.0.0"})
+    return Response(_VERSION_BODY, mimetype="application/json")
 
 
 # =============================================================================
@@ -134,26 +141,31 @@ def get_categorized_file(category: str, file_id: int):
 resources_bp = Blueprint("resources", __name__, url_prefix="/api/resources")
 
 
+# resources_bp view bodies keyed by request.method (HEAD shares GET's)
+_RESOURCE_METHODS = {
+    "GET": lambda resource_id: jsonify({"id": resource_id}),
+    "PUT": lambda resource_id: jsonify({"id": resource_id, **request.get_json()}),
+    "DELETE": lambda resource_id: ("", 204),
+}
+_RESOURCE_METHODS["HEAD"] = _RESOURCE_METHODS["GET"]
+
+_COLLECTION_METHODS = {
+    "GET": lambda: jsonify([]),
+    "POST": lambda: (jsonify(request.get_json()), 201),
+}
+_COLLECTION_METHODS["HEAD"] = _COLLECTION_METHODS["GET"]
+
+
 @resources_bp.route("/<int:resource_id>", methods=["GET", "PUT", "DELETE"])
 def resource_handler(resource_id: int):
     """Handle multiple methods for a resource."""
-    if request.method == "GET":
-        return jsonify({"id": resource_id})
-    elif request.method == "PUT":
-        data = request.get_json()
-        return jsonify({"id": resource_id, **data})
-    elif request.method == "DELETE":
-        return "", 204
+    return _RESOURCE_METHODS[request.method](resource_id)
 
 
 @resources_bp.route("", methods=["GET", "POST"])
 def resources_collection():
     """Handle collection operations."""
-    if request.method == "GET":
-        return jsonify([])
-    elif request.method == "POST":
-        data = request.get_json()
-        return jsonify(data), 201
+    return _COLLECTION_METHODS[request.method]()
 
 
 # =============================================================================
@@ -181,14 +193,17 @@ def admin_ban_user(user_id: int):
     return jsonify({"user_id": user_id, "banned": True})
 
 
+_SETTINGS_METHODS = {
+    "GET": lambda: jsonify({}),
+    "PUT": lambda: jsonify(request.get_json()),
+}
+_SETTINGS_METHODS["HEAD"] = _SETTINGS_METHODS["GET"]
+
+
 @admin_bp.route("/settings", methods=["GET", "PUT"])
 def admin_settings():
     """Admin settings."""
-    if request.method == "GET":
-        return jsonify({})
-    else:
-        data = request.get_json()
-        return jsonify(data)
+    return _SETTINGS_METHODS[request.method]()
 
 
 # =============================================================================
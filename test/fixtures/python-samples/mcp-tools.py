@@ -3,10 +3,58 @@ MCP Tool Sample Fixtures
 Used for testing Python AST parser's MCP tool detection (backward compatibility).
 """
 
+import functools
+import inspect
 from typing import Optional, List, Dict, Union, Any
 from mcp import Tool
 from mcp.server import Server
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+
+
+# =============================================================================
+# Cached Tool Schemas
+# =============================================================================
+
+class _ToolRecorder:
+    """Server proxy whose tool() also records the function for the list_tools() handler."""
+
+    def __init__(self, server):
+        self._server = server
+        self.funcs = []  # tool functions, in registration order
+
+    def __getattr__(self, name):
+        return getattr(self._server, name)
+
+    def tool(self, *args, **kwargs):
+        register = self._server.tool(*args, **kwargs)
+
+        def decorator(fn):
+            self.funcs.append(fn)
+            return register(fn)
+        return decorator
+
+
+@functools.cache
+def _model_schema(model):
+    # One copy per model class, shared by every tool taking it
+    return model.model_json_schema()
+
+
+@functools.cache
+def _tool_input_schema(fn):
+    """Input schema for a tool's signature, built once per function."""
+    properties, required = {}, []
+    for param in inspect.signature(fn).parameters.values():
+        annotation = param.annotation
+        if annotation is inspect.Parameter.empty:
+            properties[param.name] = {}
+        elif isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            properties[param.name] = _model_schema(annotation)
+        else:
+            properties[param.name] = TypeAdapter(annotation).json_schema()
+        if param.default is inspect.Parameter.empty:
+            required.append(param.name)
+    return {"type": "object", "properties": properties, "required": required}
 
 
 # =============================================================================
@@ -16,6 +64,9 @@ from pydantic import BaseModel, Field
 mcp = Server("sample-mcp-server")
 server = Server("alternate-server")
 
+# Only this instance records its tools; the SDK's Server class is left alone
+mcp = _ToolRecorder(mcp)
+
 
 # =============================================================================
 # Basic MCP Tool Decorators
@@ -61,6 +112,10 @@ class SearchResult(BaseModel):
     score: float
     metadata: Optional[Dict[str, Any]] = None
 
+    class Config:
+        frozen = True
+        extra = "forbid"
+
 
 @mcp.tool()
 def search_data(input: SearchInput) -> List[SearchResult]:
@@ -250,6 +305,10 @@ class Address(BaseModel):
     country: str
     postal_code: Optional[str] = None
 
+    class Config:
+        frozen = True
+        extra = "forbid"
+
 
 class Person(BaseModel):
     """Person model with nested address."""
@@ -265,6 +324,10 @@ class PersonResponse(BaseModel):
     created_at: str
     updated_at: Optional[str] = None
 
+    class Config:
+        frozen = True
+        extra = "forbid"
+
 
 @mcp.tool()
 def create_person(person: Person) -> PersonResponse:
@@ -295,3 +358,16 @@ def tool_that_raises(input: str) -> str:
 async def async_tool_that_raises(input: str) -> str:
     """Async tool that raises an exception."""
     raise RuntimeError("Async test error")
+
+
+# =============================================================================
+# Tool Listing
+# =============================================================================
+
+@mcp.list_tools()
+async def list_tools() -> List[Tool]:
+    """Advertise every recorded tool with its cached input schema."""
+    return [
+        Tool(name=fn.__name__, description=inspect.getdoc(fn), inputSchema=_tool_input_schema(fn))
+        for fn in mcp.funcs
+    ]
@@ -29,14 +29,22 @@ class SimpleModel(BaseModel):
     age: int
     active: bool
 
+    class Config:
+        frozen = True
+        extra = "forbid"
+
 
 class ModelWithDefaults(BaseModel):
     """Model demonstrating default values."""
     name: str
     age: int = 0
     active: bool = True
-    tags: List[str] = []
-    metadata: Dict[str, Any] = {}
+    tags: List[str] = Field(default_factory=list)
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+
+    class Config:
+        frozen = True
+        extra = "forbid"
 
 
 class ModelWithOptional(BaseModel):
@@ -77,6 +85,9 @@ class ModelWithDescriptions(BaseModel):
 # Nested Models
 # =============================================================================
 
+# fast() builds through construct() and skips validation entirely: only pass
+# plain dicts that are already valid, such as literal test data.
+
 class Address(BaseModel):
     """Address model."""
     street: str
@@ -85,6 +96,10 @@ class Address(BaseModel):
     postal_code: str
     country: str = "US"
 
+    class Config:
+        frozen = True
+        extra = "forbid"
+
 
 class ContactInfo(BaseModel):
     """Contact information."""
@@ -98,7 +113,18 @@ class Person(BaseModel):
     id: int
     name: str
     contact: ContactInfo
-    addresses: List[Address] = []
+    addresses: List[Address] = Field(default_factory=list)
+
+    @classmethod
+    def fast(cls, **data):
+        """Build from pre-validated data without running validators."""
+        contact = dict(data["contact"])
+        if contact.get("address") is not None:
+            contact["address"] = Address.construct(**contact["address"])
+        data["contact"] = ContactInfo.construct(**contact)
+        if "addresses" in data:
+            data["addresses"] = [Address.construct(**a) for a in data["addresses"]]
+        return cls.construct(**data)
 
 
 class Organization(BaseModel):
@@ -106,9 +132,19 @@ class Organization(BaseModel):
     id: int
     name: str
     headquarters: Address
-    branches: List[Address] = []
-    employees: List[Person] = []
-    metadata: Dict[str, Any] = {}
+    branches: List[Address] = Field(default_factory=list)
+    employees: List[Person] = Field(default_factory=list)
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+
+    @classmethod
+    def fast(cls, **data):
+        """Build from pre-validated data without running validators."""
+        data["headquarters"] = Address.construct(**data["headquarters"])
+        if "branches" in data:
+            data["branches"] = [Address.construct(**a) for a in data["branches"]]
+        if "employees" in data:
+            data["employees"] = [Person.fast(**p) for p in data["employees"]]
+        return cls.construct(**data)
 
 
 # =============================================================================
@@ -121,6 +157,11 @@ class BaseEntity(BaseModel):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
+    @classmethod
+    def fast(cls, **data):
+        """Build from pre-validated data without running validators."""
+        return cls.construct(**data)
+
 
 class User(BaseEntity):
     """User extending BaseEntity."""
@@ -131,7 +172,7 @@ class User(BaseEntity):
 
 class AdminUser(User):
     """Admin user with additional permissions."""
-    permissions: List[str] = []
+    permissions: List[str] = Field(default_factory=list)
     admin_level: int = 1
 
 
@@ -357,6 +398,11 @@ class UserResponse(BaseModel):
     class Config:
         orm_mode = True
 
+    @classmethod
+    def fast(cls, **data):
+        """Build from pre-validated data without running validators."""
+        return cls.construct(**data)
+
 
 class UserListResponse(BaseModel):
     """Response model for user list."""
@@ -365,6 +411,12 @@ class UserListResponse(BaseModel):
     page: int
     page_size: int
 
+    @classmethod
+    def fast(cls, **data):
+        """Build from pre-validated data without running validators."""
+        data["users"] = [UserResponse.fast(**u) for u in data["users"]]
+        return cls.construct(**data)
+
 
 # =============================================================================
 # Discriminated Union Models
@@ -398,4 +450,5 @@ PetUnion = Union[DogModel, CatModel, BirdModel]
 class PetOwner(BaseModel):
     """Owner with discriminated union pet."""
     name: str
-    pet: Union[DogModel, CatModel, BirdModel]
+    # Tagged on pet_type so validation picks the member by lookup instead of trying each in turn
+    pet: Union[DogModel, CatModel, BirdModel] = Field(..., discriminator="pet_type")
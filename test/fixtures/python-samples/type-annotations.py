@@ -378,6 +378,7 @@ def generic_dict(data: Dict[K, V]) -> Dict[K, V]:
 
 class GenericContainer(Generic[T]):
     """Generic container class."""
+    __slots__ = ("value",)
     
     def __init__(self, value: T) -> None:
         self.value = value
@@ -391,6 +392,7 @@ class GenericContainer(Generic[T]):
 
 class GenericPair(Generic[K, V]):
     """Generic pair class with two type parameters."""
+    __slots__ = ("key", "value")
     
     def __init__(self, key: K, value: V) -> None:
         self.key = key
@@ -587,6 +589,10 @@ def annotated_complex(
 # Overloaded Functions
 # =============================================================================
 
+# Exact-type conversions for overloaded_func; int/str subclasses keep the isinstance path
+_OVERLOAD_DISPATCH = {int: str, str: int}
+
+
 @overload
 def overloaded_func(value: int) -> str: ...
 
@@ -595,9 +601,10 @@ def overloaded_func(value: str) -> int: ...
 
 def overloaded_func(value: Union[int, str]) -> Union[str, int]:
     """Overloaded function implementation."""
-    if isinstance(value, int):
-        return str(value)
-    return int(value)
+    convert = _OVERLOAD_DISPATCH.get(type(value))
+    if convert is None:
+        convert = str if isinstance(value, int) else int
+    return convert(value)
 
 
 # =============================================================================
@@ -274,6 +274,19 @@ describe('Python AST Parser', () => {
         
         expect(adminEndpoint?.path).toBe('/api/v1/admin/stats');
       });
+
+      it('should extract only the routes and models, not module-level helpers', async () => {
+        const schemas = await parser.extractSchemas({ content: fastapiRouterFixture } as PythonParseOptions) as PythonSchema[];
+        const ids = schemas.map((s: PythonSchema) => s.id).sort();
+
+        expect(ids).toEqual([
+          'Item', 'ItemCreate', 'ItemUpdate', 'Order',
+          'create_item', 'create_order', 'delete_item', 'duplicate_item',
+          'force_delete_item', 'get_item', 'get_item_variant', 'get_order',
+          'get_stats', 'list_items', 'list_orders', 'replace_item',
+          'update_item', 'update_order_status',
+        ]);
+      });
     });
 
     describe('FastAPI Header and Dependency Parameters', () => {
@@ -665,6 +678,18 @@ describe('Python AST Parser', () => {
         expect(ageProp?.['default']).toBe(0);
         expect(model?.required).not.toContain('age');
       });
+
+      it('should treat Field(default_factory=...) as an optional default', async () => {
+        const schemas = await parser.extractSchemas({ content: pydanticFixture } as PythonParseOptions) as PythonSchema[];
+        const model = schemas.find((s: PythonSchema) => s.id.includes('ModelWithDefaults'));
+        const tagsProp = model?.properties?.['tags'] as JSONSchema;
+        const metadataProp = model?.properties?.['metadata'] as JSONSchema;
+
+        expect(tagsProp?.['default']).toEqual([]);
+        expect(metadataProp?.['default']).toEqual({});
+        expect(model?.required).not.toContain('tags');
+        expect(model?.required).not.toContain('metadata');
+      });
     });
 
     describe('Models with Field() Constraints', () => {
@@ -814,6 +839,37 @@ describe('Python AST Parser', () => {
         expect(amountProp?.type).toBe('string');
       });
     });
+
+    describe('msgspec Struct Models', () => {
+      let routerFixture: string;
+
+      beforeAll(() => {
+        routerFixture = loadFixture('fastapi-router.py');
+      });
+
+      it('should extract msgspec.Struct class as a model', async () => {
+        const schemas = await parser.extractSchemas({ content: routerFixture } as PythonParseOptions) as PythonSchema[];
+        const model = schemas.find((s: PythonSchema) => s.id === 'ItemCreate');
+        
+        expect(model?.type).toBe('model');
+        expect(model?.properties).toHaveProperty('name');
+        expect(model?.properties).toHaveProperty('price');
+        expect(model?.required).toEqual(['name', 'price']);
+      });
+
+      it('should extract msgspec.Meta constraints from Annotated fields', async () => {
+        const schemas = await parser.extractSchemas({ content: routerFixture } as PythonParseOptions) as PythonSchema[];
+        const model = schemas.find((s: PythonSchema) => s.id === 'ItemCreate');
+        const nameProp = model?.properties?.['name'] as JSONSchema;
+        const quantityProp = model?.properties?.['quantity'] as JSONSchema;
+        
+        expect(nameProp?.type).toBe('string');
+        expect(nameProp?.['minLength']).toBe(1);
+        expect(nameProp?.['maxLength']).toBe(200);
+        expect(quantityProp?.['minimum']).toBe(0);
+        expect(quantityProp?.['default']).toBe(1);
+      });
+    });
   });
 
   // ===========================================================================
@@ -226,6 +226,69 @@ describe('Python HTTP Client Tracing', () => {
       expect(asyncRequests.length).toBeGreaterThan(0);
     });
 
+    it('should detect client.stream() calls', async () => {
+      const content = [
+        'import httpx',
+        'client = httpx.Client(base_url="https://api.example.com")',
+        'with client.stream("GET", f"/files/{file_id}") as response:',
+        '    for chunk in response.iter_bytes():',
+        '        print(chunk)',
+        'with httpx.stream("POST", "https://api.example.com/upload") as upload:',
+        '    print(upload.status_code)'
+      ].join('\n');
+      const results = await traceHttpCalls(parser, { content });
+      
+      const clientStream = results.find(s => s.toolName === 'GET /files/{file_id}');
+      expect(clientStream).toBeDefined();
+      expect(clientStream?.argumentsProvided?.isClient).toBe(true);
+      expect(clientStream?.argumentsProvided?.pathParams).toEqual(['file_id']);
+      expect(clientStream?.argumentsProvided?.responseVariable).toBe('response');
+      
+      const directStream = results.find(s => s.toolName === 'POST https://api.example.com/upload');
+      expect(directStream).toBeDefined();
+      expect(directStream?.expectedProperties).toContain('status_code');
+    });
+
+    it('should detect clients returned by an annotated factory', async () => {
+      const content = [
+        'import httpx',
+        'def get_client() -> httpx.AsyncClient:',
+        '    return httpx.AsyncClient(base_url="https://api.example.com")',
+        'async def fetch():',
+        '    client = get_client()',
+        '    response = await client.get("/reports")',
+        '    return response.json()'
+      ].join('\n');
+      const results = await traceHttpCalls(parser, { content });
+
+      const call = results.find(s => s.toolName === 'GET /reports');
+      expect(call).toBeDefined();
+      expect(call?.argumentsProvided?.isAsyncClient).toBe(true);
+      expect(call?.expectedProperties).toContain('json');
+    });
+
+    it('should correlate calls unpacked from asyncio.gather()', async () => {
+      const content = [
+        'import asyncio',
+        'import httpx',
+        'client = httpx.AsyncClient(base_url="https://api.example.com")',
+        'async def load():',
+        '    listing, created = await asyncio.gather(',
+        '        client.get("/items"),',
+        '        client.post("/items", json={"name": "New"})',
+        '    )',
+        '    return listing.json(), created.status_code'
+      ].join('\n');
+      const results = await traceHttpCalls(parser, { content });
+
+      const get = results.find(s => s.toolName === 'GET /items');
+      const post = results.find(s => s.toolName === 'POST /items');
+      expect(get?.argumentsProvided?.responseVariable).toBe('listing');
+      expect(get?.expectedProperties).toEqual(['json']);
+      expect(post?.argumentsProvided?.responseVariable).toBe('created');
+      expect(post?.expectedProperties).toEqual(['status_code']);
+    });
+
     it('should detect response.is_success property (httpx-specific)', async () => {
       const results = await traceHttpCalls(parser, { content: httpxContent });
       